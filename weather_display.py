@@ -1,41 +1,84 @@
 import codecs
 import configparser
+import functools
+import hashlib
 import json
 import os
+import shutil
+import statistics
 import sys
+import threading
 import time
+import urllib.error
 import urllib.request
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
 import cairosvg
 import pygame
 import webcolors
 
+# Event posted by the pygame timer whenever the display should be refreshed.
+REFRESH_EVENT = pygame.USEREVENT + 1
+REFRESH_INTERVAL_MS = 5000
 
+# Returned when a conditional request reports that the previously fetched data is still current.
+NOT_MODIFIED = object()
+
+
+@dataclass(slots=True)
 class Forecast:
     """Container class for individual forecasts"""
-    condition_id = -1
-    condition_text = 'N/A'
-    condition_time = 'general'
-    humidity = -1
-    precip_chance = -1
-    temp = -1
-    timestamp = -1
+    condition_id: int = -1
+    condition_text: str = 'N/A'
+    condition_time: str = 'general'
+    humidity: float = -1
+    precip_chance: float = -1
+    temp: float = -1
+    timestamp: int = -1
 
 
+@dataclass(slots=True)
 class Weather:
     """Container class for current weather conditions"""
-    condition_id = -1
-    condition_text = 'N/A'
-    condition_time = 'general'
-    hourly_precip = 0  # measured in mm
-    humidity = -1
-    temp = -1
-    timezone = -1
-    wind_speed = -1
-    wind_dir = "N/A"
-
-
+    condition_id: int = -1
+    condition_text: str = 'N/A'
+    condition_time: str = 'general'
+    hourly_precip: float = 0  # measured in mm
+    humidity: float = -1
+    temp: float = -1
+    timezone: int = -1
+    wind_speed: float = -1
+    wind_dir: float | str = "N/A"
+
+
+@dataclass(frozen=True)
+class DisplaySettings:
+    """Display options, read from the config once at startup"""
+    print_only: bool
+    width: int
+    height: int
+    border: int
+    background_color: str
+    foreground_color: str
+    font: str
+    font_size: int
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(print_only=config.getboolean('display', 'print_only', fallback=False),
+                   width=config.getint('display', 'width'),
+                   height=config.getint('display', 'height'),
+                   border=config.getint('display', 'border'),
+                   background_color=config.get('display', 'background_color', fallback='white'),
+                   foreground_color=config.get('display', 'foreground_color', fallback='black'),
+                   font=config.get('display', 'font', fallback='arial'),
+                   font_size=config.getint('display', 'font_size', fallback=10))
+
+
+@functools.lru_cache(maxsize=32)
 def get_rgb(color):
     """Tries to generate a (red, green, blue) tuple from a hex value or color name string.
        If an appropriate value cannot be parsed, the program is terminated."""
@@ -53,6 +96,7 @@ def get_rgb(color):
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=32)
 def get_hex(color):
     """Tries to generate a hex value string from a partial hex value or color name string.
        If an appropriate value cannot be parsed, the program is terminated."""
@@ -70,6 +114,34 @@ def get_hex(color):
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=128)
+def format_timestamp(timestamp, date_format):
+    """Formats a timestamp in local time. Results are cached, since the 3-hourly forecast timestamps
+       stay the same across several weather fetches."""
+    return datetime.fromtimestamp(timestamp).strftime(date_format)
+
+
+def rasterize_svg(svg, path):
+    """Rasterizes SVG content to a PNG image at the given path."""
+    cairosvg.svg2png(bytestring=svg, write_to=path, output_width=300, output_height=300)
+
+
+def tint_image(source_path, path, rgb):
+    """Recolors a single color image by replacing its color channels while keeping its transparency."""
+    image = pygame.image.load(source_path)
+    image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_RGBA_MULT)
+    image.fill((rgb[0], rgb[1], rgb[2], 0), special_flags=pygame.BLEND_RGBA_ADD)
+    pygame.image.save(image, path)
+
+
+@functools.lru_cache(maxsize=64)
+def load_scaled_image(path, width, height):
+    """Loads an image from disk and scales it to the given size. Results are cached, since
+       the same small set of icons is redrawn on every refresh."""
+    image = pygame.image.load(path).convert_alpha()
+    return pygame.transform.smoothscale(image, (width, height))
+
+
 class WeatherDataDisplay:
     """Generates a small weather display to a local interface"""
     _last_refresh = 0
@@ -83,45 +155,48 @@ class WeatherDataDisplay:
     _weather_precip_sprite = None
     _wind_icon_sprite = None
     _weather_wind_sprite = None
-    _forecast_sprites = []
+    _forecast_sprites = None
     _last_update_sprite = None
     _internet_status_sprite = None
     _all_sprites = None
+    _sprite_blits = None
 
     def __init__(self, config):
-        self._config = config
+        self._display_settings = DisplaySettings.from_config(config)
+        self._forecast_sprites = []
         self._data_fetcher = WeatherDataFetcher(config)
         self._image_selector = WeatherImageSelector(config)
         self._formatter = WeatherFormatter(config)
 
     def run(self):
-        if config_data.getboolean('display', 'print_only'):
+        if self._display_settings.print_only:
             self.print_display()
             return
+        self._data_fetcher.start()
         self._init_display()
+        pygame.time.set_timer(REFRESH_EVENT, REFRESH_INTERVAL_MS)
 
         done = False
         while not done:
-            pygame.time.wait(5000)
-            for event in pygame.event.get():
-                if event == pygame.QUIT:
-                    done = True
-            self._update_display()
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                done = True
+            elif event.type == REFRESH_EVENT:
+                self._update_display()
 
     def _init_display(self):
-        width = self._config.getint('display', 'width')
-        height = self._config.getint('display', 'height')
-        border = self._config.getint('display', 'border')
-        color = self._config.get('display', 'foreground_color', fallback='black')
-        font = self._config.get('display', 'font', fallback='arial')
-        font_size = self._config.getint('display', 'font_size', fallback=10)
+        settings = self._display_settings
+        width, height, border = settings.width, settings.height, settings.border
+        color, font, font_size = settings.foreground_color, settings.font, settings.font_size
+
+        # Only the display needs images, so print-only mode never rasterizes any.
+        self._image_selector.generate_custom_images()
 
         pygame.init()
         pygame.mouse.set_visible(False)
         self._screen = pygame.display.set_mode((width, height), pygame.NOFRAME)
-        self._background = pygame.Surface((width, height))
-        self._background.convert()
-        self._background.fill(get_rgb(self._config.get('display', 'background_color', fallback='white')))
+        self._background = pygame.Surface((width, height)).convert()
+        self._background.fill(get_rgb(settings.background_color))
 
         # Divide the screen into segments on a 12 x 9 grid, as shown below:
         #
@@ -163,7 +238,8 @@ class WeatherDataDisplay:
         self._humidity_icon_sprite = IconSprite(self._image_selector.get_icon("humidity"), width_unit, height_unit,
                                                 color, width_unit * 8 + border,
                                                 border)
-        self._all_sprites.add(self._humidity_icon_sprite)
+        # Icons that never change are drawn onto the background once instead of on every refresh.
+        self._background.blit(self._humidity_icon_sprite.image, self._humidity_icon_sprite.rect)
         self._weather_humidity_sprite = TextSprite(font, font_size, color, width_unit * 3, height_unit,
                                                    width_unit * 9 + border, border + border, False)
         self._all_sprites.add(self._weather_humidity_sprite)
@@ -172,7 +248,7 @@ class WeatherDataDisplay:
         self._precip_icon_sprite = IconSprite(self._image_selector.get_icon("precipitation"), width_unit, height_unit,
                                               color, width_unit * 8 + border,
                                               height_unit + border)
-        self._all_sprites.add(self._precip_icon_sprite)
+        self._background.blit(self._precip_icon_sprite.image, self._precip_icon_sprite.rect)
         self._weather_precip_sprite = TextSprite(font, font_size, color, width_unit * 3, height_unit,
                                                  width_unit * 9 + border, height_unit + border, False)
         self._all_sprites.add(self._weather_precip_sprite)
@@ -181,37 +257,37 @@ class WeatherDataDisplay:
         self._wind_icon_sprite = IconSprite(self._image_selector.get_icon("wind"), width_unit, height_unit, color,
                                             width_unit * 8 + border,
                                             height_unit * 2 + border)
-        self._all_sprites.add(self._wind_icon_sprite)
+        self._background.blit(self._wind_icon_sprite.image, self._wind_icon_sprite.rect)
         self._weather_wind_sprite = TextSprite(font, font_size, color, width_unit * 3, height_unit,
                                                width_unit * 9 + border, height_unit * 2 + border, False)
         self._all_sprites.add(self._weather_wind_sprite)
 
         # Display the next four 3-hourly forecasts.
+        precip_chance_icon = self._image_selector.get_icon("precipitation_chance")
         for i in range(4):
+            column_x = i * (width_unit * 3) + border
+
             # Time display
             forecast_date_sprite = TextSprite(font, font_size, color, width_unit * 3, height_unit * 1,
-                                              i * (width_unit * 3) + border, height_unit * 3 + border)
+                                              column_x, height_unit * 3 + border)
             self._all_sprites.add(forecast_date_sprite)
 
             # Forecast icon display
             weather_icon_sprite = WeatherIconSprite(self._image_selector, width_unit * 3, height_unit * 2, color,
-                                                    i * (width_unit * 3) + border, height_unit * 4 + border)
+                                                    column_x, height_unit * 4 + border)
             self._all_sprites.add(weather_icon_sprite)
 
             # Forecast temperature display
             forecast_temp_sprite = TextSprite(font, font_size, color, width_unit * 3, height_unit * 1,
-                                              i * (width_unit * 3) + border, height_unit * 6 + border)
+                                              column_x, height_unit * 6 + border)
             self._all_sprites.add(forecast_temp_sprite)
 
             # Precipitation chance display
-            precip_chance_icon_sprite = IconSprite(self._image_selector.get_icon("precipitation_chance"), width_unit,
-                                                   height_unit, color,
-                                                   i * (width_unit * 3) + border,
-                                                   height_unit * 7 + border)
-            self._all_sprites.add(precip_chance_icon_sprite)
+            precip_chance_icon_sprite = IconSprite(precip_chance_icon, width_unit, height_unit, color,
+                                                   column_x, height_unit * 7 + border)
+            self._background.blit(precip_chance_icon_sprite.image, precip_chance_icon_sprite.rect)
             forecast_precip_sprite = TextSprite(font, font_size, color, width_unit * 2, height_unit * 1,
-                                                i * (width_unit * 3) + width_unit + border, height_unit * 7 + border,
-                                                False)
+                                                column_x + width_unit, height_unit * 7 + border, False)
             self._all_sprites.add(forecast_precip_sprite)
 
             self._forecast_sprites.append(
@@ -227,20 +303,26 @@ class WeatherDataDisplay:
         self._internet_status_sprite = TextSprite(font, font_size + 2, "red", width_unit * 3, height_unit * 1,
                                                   (width_unit * 9) + border, height_unit * 8 + border)
         self._all_sprites.add(self._internet_status_sprite)
+
+        # Sprites keep their image surfaces and positions, so the blit sequence only needs building once.
+        self._sprite_blits = [(sprite.image, sprite.rect) for sprite in self._all_sprites]
+
+        # Draw the full background once; later refreshes only update the areas of changed sprites.
+        self._screen.blit(self._background, (0, 0))
+        pygame.display.flip()
         self._update_display()
 
     def _update_display(self):
         """Updates the display sprites to reflect the most recent weather data and forecast."""
-        self._data_fetcher.update_data()
+        internet_active, last_weather_update, weather, forecasts = self._data_fetcher.snapshot()
 
-        self._internet_status_sprite.update_text("OK" if self._data_fetcher.internet_active else "DOWN")
-        self._internet_status_sprite.update_color("green" if self._data_fetcher.internet_active else "red")
+        self._internet_status_sprite.update_text("OK" if internet_active else "DOWN")
+        self._internet_status_sprite.update_color("green" if internet_active else "red")
 
-        if self._data_fetcher.last_weather_update > self._last_refresh:
+        if last_weather_update > self._last_refresh:
             self._last_update_sprite.update_text(
-                "Last Update: " + self._formatter.format_datetime(self._data_fetcher.last_weather_update))
+                "Last Update: " + self._formatter.format_datetime(last_weather_update))
 
-            weather = self._data_fetcher.weather
             if weather is not None:
                 self._weather_icon_sprite.update_condition(weather.condition_id, weather.condition_time)
                 self._weather_temp_sprite.update_text(self._formatter.format_temp(weather.temp, ""))
@@ -249,7 +331,6 @@ class WeatherDataDisplay:
                 self._weather_wind_sprite.update_text(
                     self._formatter.format_wind_speed(weather.wind_speed, weather.wind_dir))
 
-                forecasts = self._data_fetcher.forecasts
                 if forecasts is not None:
                     for i in range(4):
                         self._forecast_sprites[i][0].update_text(self._formatter.format_time(forecasts[i].timestamp))
@@ -258,12 +339,17 @@ class WeatherDataDisplay:
                         self._forecast_sprites[i][2].update_text(self._formatter.format_temp(forecasts[i].temp))
                         self._forecast_sprites[i][4].update_text(
                             self._formatter.format_percentage(forecasts[i].precip_chance))
-                self._last_refresh = self._data_fetcher.last_weather_update
+                self._last_refresh = last_weather_update
             print("Display data updated.")
 
-        self._all_sprites.clear(self._screen, self._background)
-        self._all_sprites.draw(self._screen)
-        pygame.display.flip()
+        # Sprite images are opaque and cover their whole rect, so there is nothing to clear first.
+        self._screen.blits(self._sprite_blits, doreturn=False)
+        dirty_rects = []
+        for sprite in self._all_sprites:
+            if sprite.dirty:
+                dirty_rects.append(sprite.rect)
+                sprite.dirty = False
+        pygame.display.update(dirty_rects)
 
     def print_display(self):
         """Prints the current weather data and forecast to the console."""
@@ -301,22 +387,23 @@ class IconSprite(pygame.sprite.Sprite):
         self._color = color
         self._x_pos = x_pos
         self._y_pos = y_pos
+        self.image = pygame.Surface((width, height)).convert()
+        self.rect = self.image.get_rect()
+        self.rect.x = x_pos
+        self.rect.y = y_pos
         self._load_image()
 
     def _get_path(self):
         return self._icon_path
 
     def _load_image(self):
-        image = pygame.image.load(self._get_path())
         min_side = min(self._width, self._height)
-        image = pygame.transform.scale(image, (min_side, min_side))
-        self.image = pygame.Surface((self._width, self._height))
+        image = load_scaled_image(self._get_path(), min_side, min_side)
+        self.image.fill((0, 0, 0))
         # Center the resized icon in the space
         self.image.blit(image, [int(self._width / 2 - min_side / 2),
                                 int(self._height / 2 - min_side / 2)])
-        self.rect = self.image.get_rect()
-        self.rect.x = self._x_pos
-        self.rect.y = self._y_pos
+        self.dirty = True
 
     def update(self):
         self._load_image()
@@ -335,6 +422,8 @@ class WeatherIconSprite(IconSprite):
         return self._image_selector.get_image(self._condition_id, self._condition_time)
 
     def update_condition(self, condition_id, condition_time):
+        if (condition_id, condition_time) == (self._condition_id, self._condition_time):
+            return
         self._condition_id = condition_id
         self._condition_time = condition_time
         self._load_image()
@@ -347,29 +436,39 @@ class TextSprite(pygame.sprite.Sprite):
         super().__init__()
         self._font = pygame.font.SysFont(font, size)
         self._color = color
+        self._rgb = get_rgb(color)
         self._width = width
         self._height = height
         self._x_pos = x_pos
         self._y_pos = y_pos
         self._text = "N/A"
         self._center = center
+        self.image = pygame.Surface((width, height)).convert()
+        self.rect = self.image.get_rect()
+        self.rect.x = x_pos
+        self.rect.y = y_pos
+        self._load_text()
 
     def _load_text(self):
-        self.textSurf = self._font.render(self._text, 1, get_rgb(self._color))
-        self.image = pygame.Surface((self._width, self._height))
+        self.textSurf = self._font.render(self._text, 1, self._rgb)
+        self.image.fill((0, 0, 0))
         # Center the text image in the space
         self.image.blit(self.textSurf, [int(self._width / 2 - self.textSurf.get_width() / 2) if self._center else 0,
                                         int(self._height / 2 - self.textSurf.get_height() / 2)])
-        self.rect = self.image.get_rect()
-        self.rect.x = self._x_pos
-        self.rect.y = self._y_pos
+        self.dirty = True
 
     def update_text(self, text):
+        # Only re-render when the displayed text actually changes.
+        if text == self._text:
+            return
         self._text = text
         self._load_text()
 
     def update_color(self, color):
+        if color == self._color:
+            return
         self._color = color
+        self._rgb = get_rgb(color)
         self._load_text()
 
     def update(self):
@@ -385,6 +484,9 @@ class WeatherFormatter:
         self._time_format = config['location']['time_format']
         self._date_format = config['location']['date_format']
         self._units = config['location']['units']
+        # Closest cardinal direction for each whole degree, for the wind directions defined.
+        self._wind_directions = [self.directions[round(degree / (360.0 / len(self.directions))) % len(self.directions)]
+                                 for degree in range(360)]
         self.temp_unit = "°K"
         self.wind_unit = "m/s"
         if self._units == "metric":
@@ -394,9 +496,7 @@ class WeatherFormatter:
             self._wind_unit = "mph"
 
     def format_wind_speed(self, speed, degree, label=""):
-        # Find the closest cardinal direction for the wind directions defined.
-        index = round(degree / (360.0 / len(self.directions)))
-        return "%s %d %s %s" % (label, speed, self._wind_unit, self.directions[(index % len(self.directions))])
+        return "%s %d %s %s" % (label, speed, self._wind_unit, self._wind_directions[round(degree) % 360])
 
     def format_temp(self, temp, label=""):
         return "%s %d %s" % (label, temp, self._temp_unit)
@@ -422,22 +522,33 @@ class WeatherFormatter:
                 self.format_percentage((forecast.precip_chance * 100), "P:"))
 
     def format_datetime(self, timestamp):
+        # Not cached: this formats update times, which are different on every call.
         return datetime.fromtimestamp(timestamp).strftime(self._date_format)
 
     def format_time(self, timestamp):
-        return datetime.fromtimestamp(timestamp).strftime(self._time_format)
+        return format_timestamp(timestamp, self._time_format)
 
 
 class WeatherImageSelector:
     """Stores weather image mappings and fetches the correct image based on the weather"""
     _image_mappings = {}
+    icon_files = {
+        "humidity": "wi-humidity.png",
+        "precipitation": "wi-raindrops.png",
+        "wind": "wi-strong-wind.png",
+        "precipitation_chance": "wi-umbrella.png",
+    }
 
     def __init__(self, config):
         self._image_dir = config['icons']['image_dir']
         self._mapping_file = config['icons']['mapping_file']
         self._color = config['icons']['image_color']
         self._svg_dir = config.get('icons', 'svg_dir', fallback=None)
+        self._manifest_file = os.path.join(self._image_dir, 'cache_manifest.json')
+        self._image_paths = {}
         self._init_images()
+        self._rast_cache = self._load_rast_cache()
+        self._rast_cache_changed = False
 
     def _init_images(self):
         print("Starting image initialization.")
@@ -457,20 +568,18 @@ class WeatherImageSelector:
             print("Created image dir ", path)
         self._image_dir = path
 
-        mappings = {}
+        mappings = defaultdict(dict)
         try:
             # Load the condition code/time of day to image filename mappings.
-            handler = open(self._mapping_file, 'r')
-            for line in handler.readlines():
-                pieces = line.strip().split(',')
-                weather_id = int(pieces[0])
-                if weather_id not in mappings:
-                    mappings[weather_id] = {}
-                mappings[weather_id][pieces[1].strip()] = pieces[2].strip()
+            with open(self._mapping_file, 'r') as handler:
+                for line in handler:
+                    weather_id, condition_time, filename = line.strip().split(',', 2)
+                    mappings[int(weather_id)][condition_time.strip()] = filename.strip()
         except Exception as e:
             print("Invalid image mapping file: %s" % e)
             sys.exit(1)
-        self._image_mappings = mappings
+        # Convert back to a plain dict so that lookups of unknown conditions don't add entries.
+        self._image_mappings = dict(mappings)
 
         print("Images initialized.")
         self._initialized = True
@@ -485,51 +594,141 @@ class WeatherImageSelector:
             return False
         return True
 
+    def _load_rast_cache(self):
+        """Loads the SVG hash to rasterized PNG path manifest, if one has been written."""
+        try:
+            with open(self._manifest_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_rast_cache(self):
+        self._rast_cache_changed = False
+        try:
+            with open(self._manifest_file, 'w') as f:
+                json.dump(self._rast_cache, f)
+        except OSError as e:
+            print("Unable to write image cache manifest: ", e)
+
+    def _link_image(self, source_path, path):
+        try:
+            os.link(source_path, path)
+        except OSError:
+            shutil.copyfile(source_path, path)
+
+    def _prepare_custom_image(self, path, filename):
+        """Returns a (cache key, shape cache key, colored SVG) tuple for an image that still needs to be rasterized,
+           or None if the image already exists or could be made from an earlier rasterization."""
+        if os.path.exists(path):
+            return None
+        with open(os.path.join(self._svg_dir, filename.replace(".png", ".svg")), 'rb') as f:
+            svg_bytes = f.read()
+
+        # Reuse an existing rasterization of the same SVG content in the same color and size.
+        key = hashlib.sha1(svg_bytes + self._color.encode() + b'300x300').hexdigest()
+        cached_path = self._rast_cache.get(key)
+        if cached_path is not None and os.path.exists(cached_path):
+            self._link_image(cached_path, path)
+            return None
+
+        # A rasterization of the same SVG in any other color only needs to be recolored.
+        shape_key = hashlib.sha1(svg_bytes + b'300x300').hexdigest()
+        shape_path = self._rast_cache.get(shape_key)
+        if shape_path is not None and os.path.exists(shape_path):
+            tint_image(shape_path, path, get_rgb(self._color))
+            # The manifest is written once by the caller rather than after every recolored image.
+            self._rast_cache[key] = path
+            self._rast_cache_changed = True
+            return None
+
+        # Convert the SVG image to a PNG image in the requested color and store it in the color's image directory.
+        content = codecs.decode(svg_bytes, 'utf-8', errors='ignore')
+        old_style = 'style="'
+        new_style = 'style="fill:%s;stroke:%s;' % (self._color, self._color)
+        return key, shape_key, content.replace(old_style, new_style)
+
+    def _rasterize(self, jobs):
+        """Rasterizes a {cache key: (colored SVG, PNG path, shape cache key)} dict of images in parallel worker
+           processes. The memory cairosvg holds on to is released when the workers exit rather than kept by the
+           display."""
+        svgs = [svg for svg, _, _ in jobs.values()]
+        paths = [path for _, path, _ in jobs.values()]
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                list(executor.map(rasterize_svg, svgs, paths))
+        except Exception as e:
+            print("Unable to generate custom images: ", e)
+            sys.exit(1)
+        for key, (_, path, shape_key) in jobs.items():
+            self._rast_cache[key] = path
+            self._rast_cache[shape_key] = path
+        self._save_rast_cache()
+
     def _maybe_generate_custom_image(self, path, filename):
-        if not os.path.exists(path):
-            # Convert the SVG image to a PNG image in the requested color and store it in the color's image directory.
-            with codecs.open(os.path.join(self._svg_dir, filename.replace(".png", ".svg")), encoding='utf-8',
-                             errors='ignore') as f:
-                content = f.read()
-                old_style = 'style="'
-                new_style = 'style="fill:%s;stroke:%s;' % (self._color, self._color)
-                new_svg = content.replace(old_style, new_style)
-                cairosvg.svg2png(bytestring=new_svg, write_to=os.path.join(self._image_dir, filename),
-                                 output_width=300, output_height=300)
+        job = self._prepare_custom_image(path, filename)
+        if job is not None:
+            key, shape_key, svg = job
+            self._rasterize({key: (svg, path, shape_key)})
+        elif self._rast_cache_changed:
+            self._save_rast_cache()
+
+    def generate_custom_images(self):
+        """Generates every image that can be displayed up front, rasterizing them all in one parallel batch."""
+        filenames = {filename for condition_map in self._image_mappings.values() for filename in condition_map.values()}
+        filenames.update(self.icon_files.values())
+        filenames.add("wi-na.png")
+
+        jobs = {}
+        duplicates = []
+        for filename in sorted(filenames):
+            path = os.path.join(self._image_dir, filename)
+            job = self._prepare_custom_image(path, filename)
+            if job is None:
+                continue
+            key, shape_key, svg = job
+            if key in jobs:
+                # Identical content is only rasterized once and copied afterwards.
+                duplicates.append((key, path))
+            else:
+                jobs[key] = (svg, path, shape_key)
+
+        if jobs:
+            print("Generating %d custom images." % len(jobs))
+            self._rasterize(jobs)
+        for key, path in duplicates:
+            self._link_image(jobs[key][1], path)
+        if self._rast_cache_changed:
+            self._save_rast_cache()
+
+    def _get_image_path(self, filename):
+        # Paths are only cached once the image is known to exist, so later lookups skip the filesystem.
+        path = self._image_paths.get(filename)
+        if path is None:
+            path = os.path.join(self._image_dir, filename)
+            self._maybe_generate_custom_image(path, filename)
+            self._image_paths[filename] = path
+        return path
 
     def get_image(self, condition_id, condition_time):
         if not self._initialized:
             return None
         if not self.has_image(condition_id, condition_time):
             return self.get_unknown_image()
-        path = os.path.join(self._image_dir, self._image_mappings[condition_id][condition_time])
-        self._maybe_generate_custom_image(path, self._image_mappings[condition_id][condition_time])
-        return path
+        condition_map = self._image_mappings[condition_id]
+        return self._get_image_path(condition_map.get(condition_time, condition_map.get('general')))
 
     def get_icon(self, name):
-        filename = "wi-na.png"
-        if name == "humidity":
-            filename = "wi-humidity.png"
-        elif name == "precipitation":
-            filename = "wi-raindrops.png"
-        elif name == "wind":
-            filename = "wi-strong-wind.png"
-        elif name == "precipitation_chance":
-            filename = "wi-umbrella.png"
-
-        path = os.path.join(self._image_dir, filename)
-        self._maybe_generate_custom_image(path, filename)
-        return path
+        return self._get_image_path(self.icon_files.get(name, "wi-na.png"))
 
     def get_unknown_image(self):
-        path = os.path.join(self._image_dir, "wi-na.png")
-        self._maybe_generate_custom_image(path, "wi-na.png")
-        return path
+        return self._get_image_path("wi-na.png")
 
 
 class WeatherDataFetcher:
     """Fetches data from the weather API and parses it for processing."""
 
+    condition_times = {'d': 'day', 'n': 'night'}
+    internet_check_interval_seconds = 180
     weather = None
     forecasts = None
     last_weather_update = -1
@@ -545,42 +744,140 @@ class WeatherDataFetcher:
         self._weather_url = config['weather_api']['weather_url'].format(**params)
         self._forecast_url = config['weather_api']['forecast_url'].format(**params)
         self._poll_interval_seconds = config.getint('weather_api', 'poll_interval_seconds')
+        self._initial_poll_interval_seconds = self._poll_interval_seconds
+        self._min_poll_interval_seconds = config.getint('weather_api', 'min_poll_interval_seconds', fallback=300)
+        self._max_poll_interval_seconds = config.getint('weather_api', 'max_poll_interval_seconds', fallback=1800)
+        self._change_history = deque(maxlen=10)
         self._last_weather_fetch = 0
+        self._last_internet_check = 0
+        self._etags = {}
+        self._last_modified = {}
+        self._pending_validators = {}
+        self._lock = threading.Lock()
+        self._fetch_thread = None
+
+    def start(self):
+        """Starts polling for weather data in a background thread, so network requests never block the display."""
+        if self._fetch_thread is None:
+            self._fetch_thread = threading.Thread(target=self._run, name="WeatherDataFetcher", daemon=True)
+            self._fetch_thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                self.update_data()
+            except Exception as e:
+                # Keep polling; a dead fetch thread would leave the display showing stale data indefinitely.
+                print("Error updating weather data:", e)
+            time.sleep(min(self._poll_interval_seconds, 30))
+
+    def snapshot(self):
+        """Returns a consistent (internet_active, last_weather_update, weather, forecasts) tuple."""
+        with self._lock:
+            return self.internet_active, self.last_weather_update, self.weather, self.forecasts
+
+    def _set_internet_active(self, internet_active):
+        self._last_internet_check = time.time()
+        with self._lock:
+            self.internet_active = internet_active
 
     def _fetch_url(self, url):
+        # Make the request conditional on the previous response, so unchanged data isn't downloaded again.
+        headers = {}
+        if url in self._etags:
+            headers['If-None-Match'] = self._etags[url]
+        if url in self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified[url]
         try:
-            handler = urllib.request.urlopen(url, timeout=30)
-            return json.loads(handler.read())
+            handler = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=30)
+            content = handler.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                self._set_internet_active(True)
+                return NOT_MODIFIED
+            # The server responded, so the connection itself is working.
+            print("Error fetching URL:", e)
+            self._set_internet_active(True)
+            return None
         except Exception as e:
             print("Error fetching URL:", e)
+            self._set_internet_active(False)
+            return None
+
+        self._set_internet_active(True)
+        # Validators are only used once the data they describe has been stored, see _store_validators.
+        self._pending_validators[url] = (handler.headers.get('ETag'), handler.headers.get('Last-Modified'))
+        try:
+            return json.loads(content)
+        except Exception as e:
+            print("Error parsing URL response:", e)
             return None
 
+    def _store_validators(self):
+        for url, (etag, last_modified) in self._pending_validators.items():
+            if etag:
+                self._etags[url] = etag
+            if last_modified:
+                self._last_modified[url] = last_modified
+        self._pending_validators.clear()
+
     def _fetch_weather(self):
         self._last_weather_fetch = time.time()
+        self._pending_validators.clear()
         weather = None
         forecasts = None
 
         # Fetch the current weather.
         weather_data = self._fetch_url(self._weather_url)
-        if weather_data is not None:
+        if weather_data is NOT_MODIFIED:
+            weather = self.weather
+        elif weather_data is not None:
             weather = self._parse_current_weather(weather_data)
 
         # Fetch the forecast.
         forecast_data = self._fetch_url(self._forecast_url)
-        if forecast_data is not None:
+        if forecast_data is NOT_MODIFIED:
+            forecasts = self.forecasts
+        elif forecast_data is not None:
             forecasts = self._parse_forecasts(forecast_data)
 
-        # Only update the data if both are present.
+        # Only update the data if both are present. Data that was revalidated with a 304 response counts as
+        # updated, so the last update time keeps showing that the data is current.
         if forecasts and weather:
-            self.weather = weather
-            self.forecasts = forecasts
-            self.last_weather_update = time.time()
+            self._update_poll_interval(weather)
+            with self._lock:
+                self.weather = weather
+                self.forecasts = forecasts
+                self.last_weather_update = time.time()
+            self._store_validators()
             print("Weather data updated.")
 
+    def _update_poll_interval(self, weather):
+        """Adapts the poll interval to how often the displayed conditions are observed to change. Called on every
+           successful poll, so that quiet periods lengthen the interval as well."""
+        now = time.time()
+        previous = self.weather
+        # Temperatures are displayed as whole degrees, so smaller drifts don't count as changes.
+        if previous is None or (weather.condition_id, int(weather.temp)) != (previous.condition_id, int(previous.temp)):
+            self._change_history.append(now)
+
+        change_times = list(self._change_history)
+        change_intervals = [later - earlier for earlier, later in zip(change_times, change_times[1:])]
+        # The time since the last change counts once it is longer than the typical change interval.
+        quiet_seconds = now - change_times[-1]
+        if change_intervals:
+            expected_seconds = max(statistics.median(change_intervals), quiet_seconds)
+        else:
+            expected_seconds = max(self._initial_poll_interval_seconds * 2, quiet_seconds)
+
+        poll_interval_seconds = int(max(self._min_poll_interval_seconds,
+                                        min(expected_seconds // 2, self._max_poll_interval_seconds)))
+        if poll_interval_seconds != self._poll_interval_seconds:
+            self._poll_interval_seconds = poll_interval_seconds
+            print("Poll interval set to %d seconds." % poll_interval_seconds)
+
     def _parse_condition_time(self, icon_label):
-        if icon_label[-1] == 'd': return 'day'
-        if icon_label[-1] == 'n': return 'night'
-        return 'general'
+        return self.condition_times.get(icon_label[-1:], 'general')
 
     def _parse_forecasts(self, json_data):
         try:
@@ -624,14 +921,21 @@ class WeatherDataFetcher:
     def _fetch_internet_status(self):
         try:
             urllib.request.urlopen('http://google.com', timeout=30)
-            self.internet_active = True
+            self._set_internet_active(True)
         except Exception as e:
             print("Error fetching internet status: ", e)
-            self.internet_active = False
+            self._set_internet_active(False)
 
     def update_data(self):
-        self._fetch_internet_status()
-        if self.internet_active and (time.time() > self._last_weather_fetch + self._poll_interval_seconds):
+        now = time.time()
+        weather_due = now > self._last_weather_fetch + self._poll_interval_seconds
+        # Weather requests report the connection status themselves. Probe separately while the connection
+        # is down, to find out when the weather can be fetched again, and every few minutes between weather
+        # polls so the status doesn't go stale.
+        if not self.internet_active or (not weather_due and
+                                        now > self._last_internet_check + self.internet_check_interval_seconds):
+            self._fetch_internet_status()
+        if self.internet_active and weather_due:
             self._fetch_weather()
 
 